@@ -9,20 +9,55 @@ checks or scripted workflows (version, nodes, vms).
 from __future__ import annotations
 
 import argparse
-import json
+import copy
+import functools
 import os
+import stat
 import sys
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from proxmoxer import ProxmoxAPI
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
+from proxmox_mcp._json import dumps, dumps_indent, loads  # noqa: E402
+from proxmox_mcp.agent.node_cache import NodeCache  # noqa: E402
+
+if TYPE_CHECKING:
+    from proxmoxer import ProxmoxAPI
+
+# Upper bound on concurrent per-node requests and on pooled connections.
+MAX_FANOUT = 32
+
+
+def _emit(obj: Any) -> None:
+    """Write ``obj`` as JSON to stdout; indent only for interactive terminals."""
+    buf = dumps_indent(obj) if sys.stdout.isatty() else dumps(obj)
+    sys.stdout.buffer.write(buf + b"\n")
+    sys.stdout.buffer.flush()
 
-def _load_config(config_path: str) -> Dict[str, Any]:
-    if not os.path.isfile(config_path):
-        raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+# Parsed config files keyed by (absolute path, mtime_ns, size).
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def _load_config(config_path: str) -> Dict[str, Any]:
+    try:
+        f = open(config_path, "rb")
+    except (FileNotFoundError, IsADirectoryError):
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    with f:
+        st = os.fstat(f.fileno())
+        # Only regular files have a stable (mtime, size) to key on; pipes are read fresh.
+        key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(key) if stat.S_ISREG(st.st_mode) else None
+        if cached is None:
+            cached = loads(f.read())
+            if stat.S_ISREG(st.st_mode):
+                _CONFIG_CACHE[key] = cached
+    data = copy.deepcopy(cached)
 
     token_value: Optional[str] = data["auth"].get("token_value")
     if not token_value:
@@ -38,9 +73,12 @@ def _load_config(config_path: str) -> Dict[str, Any]:
 
 
 def _connect(cfg: Dict[str, Any]) -> ProxmoxAPI:
+    from proxmoxer import ProxmoxAPI
+    from requests.adapters import HTTPAdapter
+
     proxmox_cfg = cfg["proxmox"]
     auth_cfg = cfg["auth"]
-    return ProxmoxAPI(
+    api = ProxmoxAPI(
         host=proxmox_cfg["host"],
         port=proxmox_cfg.get("port", 8006),
         user=auth_cfg["user"],
@@ -49,28 +87,53 @@ def _connect(cfg: Dict[str, Any]) -> ProxmoxAPI:
         verify_ssl=proxmox_cfg.get("verify_ssl", True),
         service=proxmox_cfg.get("service", "PVE"),
     )
+    # Size the pool for the per-node fan-out in cmd_vms (requests defaults to 10).
+    adapter = HTTPAdapter(pool_connections=MAX_FANOUT, pool_maxsize=MAX_FANOUT)
+    api._store["session"].mount("https://", adapter)
+    return api
+
+
+_NODES_CACHE = NodeCache()
+
+
+def _get_nodes(api: ProxmoxAPI, host: str, refresh: bool = False) -> List[Dict[str, Any]]:
+    nodes = None if refresh else _NODES_CACHE.get(host)
+    if nodes is None:
+        nodes = _NODES_CACHE.put(host, api.nodes.get())
+    return nodes
 
 
 def cmd_version(api: ProxmoxAPI) -> None:
     info = api.version.get()
-    print(json.dumps(info, indent=2))
+    _emit(info)
+
 
+def cmd_nodes(api: ProxmoxAPI, host: str, refresh: bool = False) -> None:
+    nodes = _get_nodes(api, host, refresh)
+    _emit(nodes)
 
-def cmd_nodes(api: ProxmoxAPI) -> None:
-    nodes = api.nodes.get()
-    print(json.dumps(nodes, indent=2))
 
+def cmd_vms(api: ProxmoxAPI, node: Optional[str], host: str, refresh: bool = False) -> None:
+    from proxmoxer import ResourceException
 
-def cmd_vms(api: ProxmoxAPI, node: Optional[str]) -> None:
     if node:
-        qemu = api.nodes(node).qemu.get()
+        qemu = [{**vm, "node": node} for vm in api.nodes(node).qemu.get()]
     else:
-        qemu = []
-        for entry in api.nodes.get():
-            qemu.extend(api.nodes(entry["node"]).qemu.get())
-    print(json.dumps(qemu, indent=2))
-
-
+        try:
+            resources = api.cluster.resources.get(type="vm")
+            qemu = [entry for entry in resources if entry.get("type") == "qemu"]
+        except ResourceException:  # older Proxmox releases: fall back to per-node listing
+            nodes = _get_nodes(api, host, refresh)
+            qemu = []
+            if nodes:
+                with ThreadPoolExecutor(max_workers=min(MAX_FANOUT, len(nodes))) as executor:
+                    listings = executor.map(lambda e: api.nodes(e["node"]).qemu.get(), nodes)
+                    for entry, node_vms in zip(nodes, listings):
+                        qemu.extend({**vm, "node": entry["node"]} for vm in node_vms)
+    _emit(qemu)
+
+
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Proxmoxer agent helper. Uses MCP config to talk to the Proxmox API."
@@ -80,6 +143,15 @@ def build_parser() -> argparse.ArgumentParser:
         default=os.getenv("PROXMOX_MCP_CONFIG", "proxmox-config/config.json"),
         help="Path to MCP JSON config (default: %(default)s)",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help=(
+            "Re-fetch the node list instead of reusing a cached one. The cache only "
+            "lives for this process and `vms` needs it only when cluster/resources "
+            "is unavailable, so a one-shot run rarely sees a difference"
+        ),
+    )
 
     sub = parser.add_subparsers(dest="command", required=True)
     sub.add_parser("version", help="Show Proxmox API version information")
@@ -91,8 +163,8 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main(argv: Optional[list[str]] = None) -> int:
-    parser = build_parser()
+def main(argv: Optional[list[str]] = None, parser: Optional[argparse.ArgumentParser] = None) -> int:
+    parser = parser or build_parser()
     args = parser.parse_args(argv)
 
     try:
@@ -105,9 +177,9 @@ def main(argv: Optional[list[str]] = None) -> int:
     if args.command == "version":
         cmd_version(api)
     elif args.command == "nodes":
-        cmd_nodes(api)
+        cmd_nodes(api, cfg["proxmox"]["host"], args.refresh)
     elif args.command == "vms":
-        cmd_vms(api, args.node)
+        cmd_vms(api, args.node, cfg["proxmox"]["host"], args.refresh)
     else:  # pragma: no cover
         parser.error(f"Unsupported command: {args.command}")
 
@@ -8,24 +8,59 @@ the same MCP configuration and API token credentials.
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import copy
+import functools
 import os
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-from proxmox_mcp.vendor.proxmoxia import Connector, Node, Proxmox  # noqa: E402
+from proxmox_mcp._json import dumps, dumps_indent, loads  # noqa: E402
+from proxmox_mcp.agent.node_cache import NodeCache  # noqa: E402
+from proxmox_mcp.vendor.proxmoxia import (  # noqa: E402
+    Connector,
+    Proxmox,
+    ProxmoxAuthError,
+    ProxmoxHTTPError,
+)
 
+if TYPE_CHECKING:
+    from proxmox_mcp.vendor.proxmoxia.aio import AsyncProxmox
+
+
+def _emit(obj: Any) -> None:
+    """Write ``obj`` as JSON to stdout; indent only for interactive terminals."""
+    buf = dumps_indent(obj) if sys.stdout.isatty() else dumps(obj)
+    sys.stdout.buffer.write(buf + b"\n")
+    sys.stdout.buffer.flush()
 
-def load_config(config_path: str) -> Dict[str, Any]:
-    if not os.path.isfile(config_path):
-        raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+# Parsed config files keyed by (absolute path, mtime_ns, size).
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def load_config(config_path: str) -> Dict[str, Any]:
+    try:
+        f = open(config_path, "rb")
+    except (FileNotFoundError, IsADirectoryError):
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    with f:
+        st = os.fstat(f.fileno())
+        # Only regular files have a stable (mtime, size) to key on; pipes are read fresh.
+        key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(key) if stat.S_ISREG(st.st_mode) else None
+        if cached is None:
+            cached = loads(f.read())
+            if stat.S_ISREG(st.st_mode):
+                _CONFIG_CACHE[key] = cached
+    data = copy.deepcopy(cached)
 
     token_value: Optional[str] = data["auth"].get("token_value")
     if not token_value:
@@ -52,25 +87,87 @@ def connect(cfg: Dict[str, Any]) -> Proxmox:
     return Proxmox(connector)
 
 
+def connect_async(cfg: Dict[str, Any]) -> AsyncProxmox:
+    try:
+        from proxmox_mcp.vendor.proxmoxia.aio import AsyncProxmox
+    except ImportError as exc:
+        raise RuntimeError(f"--async requires httpx[http2] (pip install .[async]): {exc}") from exc
+
+    prox_cfg = cfg["proxmox"]
+    auth_cfg = cfg["auth"]
+    try:
+        client = AsyncProxmox(
+            prox_cfg["host"], prox_cfg.get("port", 8006), prox_cfg.get("verify_ssl", True)
+        )
+    except ImportError as exc:  # httpx installed without the http2 extra
+        raise RuntimeError(f"--async requires httpx[http2] (pip install .[async]): {exc}") from exc
+    client.use_api_token(auth_cfg["user"], auth_cfg["token_name"], auth_cfg["token_value"])
+    return client
+
+
+_NODES_CACHE = NodeCache()
+
+
+def get_nodes(client: Proxmox, refresh: bool = False) -> List[Dict[str, Any]]:
+    nodes = None if refresh else _NODES_CACHE.get(client.host)
+    if nodes is None:
+        nodes = _NODES_CACHE.put(client.host, client.nodes())
+    return nodes
+
+
 def cmd_version(client: Proxmox) -> None:
-    print(json.dumps(client.version(), indent=2))
+    _emit(client.version())
 
 
-def cmd_nodes(client: Proxmox) -> None:
-    print(json.dumps(client.nodes(), indent=2))
+def cmd_nodes(client: Proxmox, refresh: bool = False) -> None:
+    _emit(get_nodes(client, refresh))
 
 
-def cmd_vms(client: Proxmox, node: Optional[str]) -> None:
+def cmd_vms(client: Proxmox, node: Optional[str], refresh: bool = False) -> None:
     if node:
-        vms = Node(client.conn, node).qemu()
+        vms = [{**vm, "node": node} for vm in client.qemu_for(node)]
     else:
-        vms = []
-        for entry in client.nodes():
-            node_client = Node(client.conn, entry["node"])
-            vms.extend(node_client.qemu())
-    print(json.dumps(vms, indent=2))
-
-
+        try:
+            resources = client.cluster.resources.get(type="vm")
+            vms = [entry for entry in resources if entry.get("type") == "qemu"]
+        except (ProxmoxAuthError, ProxmoxHTTPError):  # older releases: list per node
+            nodes = get_nodes(client, refresh)
+            vms = []
+            if nodes:
+                with ThreadPoolExecutor(max_workers=min(32, len(nodes))) as executor:
+                    listings = executor.map(lambda e: client.qemu_for(e["node"]), nodes)
+                    for entry, node_vms in zip(nodes, listings):
+                        vms.extend({**vm, "node": entry["node"]} for vm in node_vms)
+    _emit(vms)
+
+
+async def aget_nodes(client: AsyncProxmox, refresh: bool = False) -> List[Dict[str, Any]]:
+    nodes = None if refresh else _NODES_CACHE.get(client.host)
+    if nodes is None:
+        nodes = _NODES_CACHE.put(client.host, await client.nodes.get())
+    return nodes
+
+
+async def cmd_vms_async(client: AsyncProxmox, node: Optional[str], refresh: bool = False) -> None:
+    async with client:
+        if node:
+            vms = [{**vm, "node": node} for vm in await client.nodes(node).qemu.get()]
+        else:
+            try:
+                resources = await client.cluster.resources.get(type="vm")
+                vms = [entry for entry in resources if entry.get("type") == "qemu"]
+            except (ProxmoxAuthError, ProxmoxHTTPError):
+                nodes = await aget_nodes(client, refresh)
+                results = await asyncio.gather(*(client.nodes(e["node"]).qemu.get() for e in nodes))
+                vms = [
+                    {**vm, "node": entry["node"]}
+                    for entry, node_vms in zip(nodes, results)
+                    for vm in node_vms
+                ]
+    _emit(vms)
+
+
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Proxmoxia agent helper. Uses MCP config and API tokens."
@@ -80,32 +177,53 @@ def build_parser() -> argparse.ArgumentParser:
         default=os.getenv("PROXMOX_MCP_CONFIG", "proxmox-config/config.json"),
         help="Path to MCP JSON config (default: %(default)s)",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help=(
+            "Re-fetch the node list instead of reusing a cached one. The cache only "
+            "lives for this process and `vms` needs it only when cluster/resources "
+            "is unavailable, so a one-shot run rarely sees a difference"
+        ),
+    )
 
     sub = parser.add_subparsers(dest="command", required=True)
     sub.add_parser("version", help="Show Proxmox API version information")
     sub.add_parser("nodes", help="List nodes")
     vms = sub.add_parser("vms", help="List virtual machines")
     vms.add_argument("--node", help="Restrict VM listing to a specific node")
+    vms.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Use the asyncio/httpx client (requires httpx[http2])",
+    )
     return parser
 
 
-def main(argv: Optional[list[str]] = None) -> int:
-    parser = build_parser()
+def main(argv: Optional[list[str]] = None, parser: Optional[argparse.ArgumentParser] = None) -> int:
+    parser = parser or build_parser()
     args = parser.parse_args(argv)
 
+    use_async = args.command == "vms" and args.use_async
     try:
         cfg = load_config(args.config)
-        client = connect(cfg)
+        if use_async:
+            async_client = connect_async(cfg)
+        else:
+            client = connect(cfg)
     except Exception as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
 
-    if args.command == "version":
+    if use_async:
+        asyncio.run(cmd_vms_async(async_client, args.node, args.refresh))
+    elif args.command == "version":
         cmd_version(client)
     elif args.command == "nodes":
-        cmd_nodes(client)
+        cmd_nodes(client, args.refresh)
     elif args.command == "vms":
-        cmd_vms(client, args.node)
+        cmd_vms(client, args.node, args.refresh)
     else:
         parser.error(f"Unsupported command: {args.command}")
 
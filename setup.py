@@ -22,6 +22,12 @@ setup(
         "pydantic>=2.0.0,<3.0.0",
     ],
     extras_require={
+        "speedups": [
+            "orjson>=3.9.0",
+        ],
+        "async": [
+            "httpx[http2]>=0.25.0",
+        ],
         "dev": [
             "pytest>=7.0.0,<8.0.0",
             "black>=23.0.0,<24.0.0",
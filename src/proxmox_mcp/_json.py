@@ -0,0 +1,61 @@
+"""
+JSON backend selection for the CLI helpers, config loader and Proxmoxia adapter.
+
+The fastest available implementation is picked once at import time
+(``orjson`` > ``ujson`` > stdlib ``json``) behind a bytes-oriented interface:
+
+- ``loads(bytes | str) -> object``
+- ``dumps(obj) -> bytes`` (compact)
+- ``dumps_indent(obj) -> bytes`` (two-space indent)
+- ``JSONDecodeError``: the backend's parse error (always a ``ValueError``)
+"""
+from typing import Any, Callable, Type, Union
+
+BACKEND: str
+loads: Callable[[Union[bytes, str]], Any]
+JSONDecodeError: Type[ValueError]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    try:
+        import ujson
+    except ImportError:
+        import json
+
+        BACKEND = "json"
+        loads = json.loads
+        JSONDecodeError = json.JSONDecodeError
+
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(obj).encode()
+
+        def dumps_indent(obj: Any) -> bytes:
+            return json.dumps(obj, indent=2).encode()
+
+    else:
+        BACKEND = "ujson"
+        loads = ujson.loads
+        JSONDecodeError = ujson.JSONDecodeError
+
+        def dumps(obj: Any) -> bytes:
+            text: str = ujson.dumps(obj)
+            return text.encode()
+
+        def dumps_indent(obj: Any) -> bytes:
+            text: str = ujson.dumps(obj, indent=2)
+            return text.encode()
+
+else:
+    BACKEND = "orjson"
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def dumps_indent(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
+__all__ = ["BACKEND", "JSONDecodeError", "dumps", "dumps_indent", "loads"]
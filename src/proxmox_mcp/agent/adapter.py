@@ -13,32 +13,64 @@ bootstrap code that the MCP server uses. It focuses on:
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Type
 
 from ..config.loader import load_config
 from ..config.models import AuthConfig, Config, ProxmoxConfig
-from ..core.proxmox import ProxmoxManager
+from .node_cache import NodeCache
 
 ClientFactory = Callable[[ProxmoxConfig, AuthConfig], Any]
+# Builds the awaitable-interface client used by alist_vms() (AsyncProxmox by default).
+AsyncClientFactory = Callable[[ProxmoxConfig, AuthConfig], Any]
 
 
-@dataclass
+def _api_errors() -> Tuple[Type[Exception], ...]:
+    """Errors the supported clients raise when the API answers with an error status.
+
+    Transport failures (timeouts, refused connections) are deliberately absent:
+    retrying them per node would only multiply the wait.
+    """
+    from proxmoxer import ResourceException  # type: ignore[import-untyped]
+
+    from ..vendor.proxmoxia import ProxmoxAuthError, ProxmoxHTTPError
+
+    return (ResourceException, ProxmoxAuthError, ProxmoxHTTPError)
+
+
+def _with_node(vms: Any, node: str) -> List[Dict[str, Any]]:
+    """Tag ``nodes/<node>/qemu`` entries with the ``node`` field they lack."""
+    return [{**vm, "node": node} for vm in vms]
+
+
+@dataclass(frozen=True, slots=True)
 class AdapterActionPlan:
     """Structured intent for a future Proxmox action.
 
     Agents can hang on to a plan object while the workflow awaits approvals
     or retries. By default plans are dry-run only; execution pipelines can
-    flip ``dry_run`` once the workflow reaches a confirmed/destructive state.
+    derive a live copy with ``dataclasses.replace(plan, dry_run=False)`` once
+    the workflow reaches a confirmed/destructive state. Plans are frozen and
+    hashable (``parameters`` is excluded from the hash), so they can be
+    deduplicated in sets or used as dict keys; append evidence with
+    ``replace(plan, evidence=plan.evidence + (item,))``. ``parameters`` is a
+    private copy of the caller's mapping and should be treated as read-only.
     """
 
     action: str
-    parameters: Dict[str, Any]
+    parameters: Dict[str, Any] = field(hash=False)
     dry_run: bool = True
     notes: Optional[str] = None
-    evidence: List[str] = field(default_factory=list)
+    evidence: Tuple[str, ...] = field(default_factory=tuple)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "parameters", dict(self.parameters))
+        object.__setattr__(self, "evidence", tuple(self.evidence))
 
 
 class ProxmoxAgentAdapter:
@@ -46,28 +78,90 @@ class ProxmoxAgentAdapter:
 
     DEFAULT_CONFIG_PATH = "proxmox-config/config.json"
     CONFIG_ENV_VAR = "PROXMOX_MCP_CONFIG"
+    NODES_CACHE_TTL = 30.0
+    # Upper bound on concurrent per-node requests and on pooled connections.
+    MAX_FANOUT = 32
+
+    # Process-wide adapters handed out by shared(), keyed by absolute config path.
+    _shared: ClassVar[Dict[str, "ProxmoxAgentAdapter"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(
         self,
         config_path: Optional[str] = None,
         *,
         client_factory: Optional[ClientFactory] = None,
+        async_client_factory: Optional[AsyncClientFactory] = None,
         auto_connect: bool = True,
         logger: Optional[logging.Logger] = None,
     ) -> None:
         self.logger = logger or logging.getLogger("proxmox-mcp.agent.adapter")
-        cfg_path = config_path or os.getenv(self.CONFIG_ENV_VAR) or self.DEFAULT_CONFIG_PATH
+        cfg_path = self._resolve_config_path(config_path)
         self.logger.debug("Loading MCP config from %s", cfg_path)
         self.config: Config = load_config(cfg_path)
         self._client_factory = client_factory or self._default_client_factory
+        self._async_client_factory = async_client_factory or self._default_async_client_factory
         self._api: Any = None
+        self._aclient: Any = None
+        self._nodes_cache = NodeCache(self.NODES_CACHE_TTL)
 
         if auto_connect:
             self.connect()
 
+    @classmethod
+    def _resolve_config_path(cls, config_path: Optional[str] = None) -> str:
+        """Apply the explicit path > env var > default precedence."""
+        return config_path or os.getenv(cls.CONFIG_ENV_VAR) or cls.DEFAULT_CONFIG_PATH
+
+    @classmethod
+    def shared(cls, config_path: Optional[str] = None) -> "ProxmoxAgentAdapter":
+        """Return a process-wide adapter for ``config_path``.
+
+        Workers in the same process (e.g. Temporal activities) share one
+        connected client and its pooled HTTP session instead of re-parsing
+        config and re-negotiating TLS per activity. Instances are keyed by the
+        resolved absolute path, so ``None``, relative and absolute spellings of
+        the same file return the same adapter, and concurrent first calls build
+        it only once. The read-only helpers are safe to call from multiple
+        threads once connected. Use ``clear_shared()`` to close and drop them.
+        """
+        key = os.path.abspath(cls._resolve_config_path(config_path))
+        with cls._shared_lock:
+            adapter = cls._shared.get(key)
+            if adapter is None:
+                adapter = cls._shared[key] = cls(key, auto_connect=True)
+            return adapter
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        """Close and forget every adapter handed out by ``shared()``."""
+        with cls._shared_lock:
+            adapters = list(cls._shared.values())
+            cls._shared.clear()
+        for adapter in adapters:
+            adapter.close()
+
     def _default_client_factory(self, prox_cfg: ProxmoxConfig, auth_cfg: AuthConfig) -> Any:
         """Default client factory that reuses the hardened ProxmoxManager."""
-        return ProxmoxManager(prox_cfg, auth_cfg).get_api()
+        # Deferred so plan-only callers never import proxmoxer.
+        from requests.adapters import HTTPAdapter
+
+        from ..core.proxmox import ProxmoxManager
+
+        api = ProxmoxManager(prox_cfg, auth_cfg).get_api()
+        # proxmoxer's session keeps requests' default 10-connection pool; size
+        # it for the per-node fan-out in list_vms().
+        adapter = HTTPAdapter(pool_connections=self.MAX_FANOUT, pool_maxsize=self.MAX_FANOUT)
+        api._store["session"].mount("https://", adapter)
+        return api
+
+    def _default_async_client_factory(self, prox_cfg: ProxmoxConfig, auth_cfg: AuthConfig) -> Any:
+        """Default async client: token-authenticated ``AsyncProxmox`` over HTTP/2."""
+        from ..vendor.proxmoxia.aio import AsyncProxmox
+
+        client = AsyncProxmox(prox_cfg.host, prox_cfg.port, prox_cfg.verify_ssl)
+        client.use_api_token(auth_cfg.user, auth_cfg.token_name, auth_cfg.resolve_token_value())
+        return client
 
     def connect(self, force: bool = False) -> Any:
         """Establish (or refresh) the underlying Proxmox API client."""
@@ -76,8 +170,42 @@ class ProxmoxAgentAdapter:
 
         self.logger.info("Connecting adapter to Proxmox host %s", self.config.proxmox.host)
         self._api = self._client_factory(self.config.proxmox, self.config.auth)
+        self._nodes_cache.clear()
         return self._api
 
+    def aconnect(self) -> Any:
+        """Return the async client, creating it on first use.
+
+        The client (and its HTTP/2 connection) is reused by every
+        ``alist_vms()`` call, so keep using it from the same event loop.
+        """
+        if self._aclient is None:
+            self.logger.info("Connecting async client to Proxmox host %s", self.config.proxmox.host)
+            self._aclient = self._async_client_factory(self.config.proxmox, self.config.auth)
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the async client as well as everything ``close()`` releases."""
+        aclient, self._aclient = self._aclient, None
+        self.close()
+        if aclient is not None:
+            await aclient.aclose()
+
+    def close(self) -> None:
+        """Release the client's HTTP session; the next call reconnects lazily.
+
+        An async client opened by ``alist_vms()`` needs ``await aclose()``.
+        """
+        api, self._api = self._api, None
+        self._nodes_cache.clear()
+        if api is None:
+            return
+
+        store = getattr(api, "_store", None)  # proxmoxer keeps its session here
+        session = store.get("session") if isinstance(store, dict) else getattr(api, "session", None)
+        if session is not None and hasattr(session, "close"):
+            session.close()
+
     @property
     def api(self) -> Any:
         """Return the connected Proxmox API client."""
@@ -92,22 +220,83 @@ class ProxmoxAgentAdapter:
         return self.connect().version.get()
 
     def list_nodes(self) -> List[Dict[str, Any]]:
-        """Return cluster nodes."""
+        """Return cluster nodes (cached for ``NODES_CACHE_TTL`` seconds)."""
         self.logger.debug("Listing Proxmox nodes")
-        return self.connect().nodes.get()
+        return self._get_nodes()
+
+    def refresh_nodes(self) -> List[Dict[str, Any]]:
+        """Drop the cached node list and fetch it again."""
+        self._nodes_cache.clear()
+        return self._get_nodes()
+
+    def _get_nodes(self) -> List[Dict[str, Any]]:
+        """Return the node list, reusing a recent result to skip a round-trip."""
+        host = self.config.proxmox.host
+        nodes = self._nodes_cache.get(host)
+        if nodes is None:
+            nodes = self._nodes_cache.put(host, self.connect().nodes.get())
+        return nodes
 
     def list_vms(self, node: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Return QEMU VMs for a node or the entire cluster."""
+        """Return QEMU VMs for a node or the entire cluster.
+
+        Every entry carries ``node`` and ``vmid``. The remaining fields depend
+        on the source: cluster-wide listings come from ``cluster/resources``
+        (``id``, ``type``, ``maxcpu``, ...) when the API offers it, otherwise
+        and for a single ``node`` from ``nodes/<node>/qemu`` (``cpus``,
+        ``pid``, ``qmpstatus``, ...).
+        """
         client = self.connect()
         if node:
             self.logger.debug("Listing VMs on node %s", node)
-            return client.nodes(node).qemu.get()
+            return _with_node(client.nodes(node).qemu.get(), node)
 
         self.logger.debug("Listing VMs across cluster")
-        vms: List[Dict[str, Any]] = []
-        for entry in client.nodes.get():
-            vms.extend(client.nodes(entry["node"]).qemu.get())
-        return vms
+        try:
+            return self.list_vms_fast()
+        except _api_errors() as exc:  # older Proxmox releases or restricted tokens
+            self.logger.debug("cluster/resources unavailable (%s); listing per node", exc)
+
+        nodes = self._get_nodes()
+        if not nodes:
+            return []
+
+        # Per-node listings are independent HTTPS round-trips; overlap them.
+        def _node_vms(entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return _with_node(client.nodes(entry["node"]).qemu.get(), entry["node"])
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_FANOUT, len(nodes))) as executor:
+            results = list(executor.map(_node_vms, nodes))
+        return [vm for node_vms in results for vm in node_vms]
+
+    async def alist_vms(self) -> List[Dict[str, Any]]:
+        """Async cluster-wide VM listing over the adapter's async client.
+
+        Uses ``cluster/resources`` when available and otherwise gathers the
+        per-node ``qemu`` listings concurrently on the running event loop,
+        reusing the cached node list; entries have the same shape as
+        ``list_vms()`` returns. The default client requires the optional
+        ``httpx[http2]`` dependency.
+        """
+        client = self.aconnect()
+        try:
+            resources = await client.cluster.resources.get(type="vm")
+            return [entry for entry in resources if entry.get("type") == "qemu"]
+        except _api_errors() as exc:
+            self.logger.debug("cluster/resources unavailable (%s); listing per node", exc)
+
+        host = self.config.proxmox.host
+        nodes = self._nodes_cache.get(host)
+        if nodes is None:
+            nodes = self._nodes_cache.put(host, await client.nodes.get())
+        results = await asyncio.gather(*(client.nodes(entry["node"]).qemu.get() for entry in nodes))
+        tagged = (_with_node(vms, entry["node"]) for entry, vms in zip(nodes, results))
+        return [vm for node_vms in tagged for vm in node_vms]
+
+    def list_vms_fast(self) -> List[Dict[str, Any]]:
+        """Return every QEMU VM in the cluster from a single ``cluster/resources`` call."""
+        resources = self.connect().cluster.resources.get(type="vm")
+        return [entry for entry in resources if entry.get("type") == "qemu"]
 
     # --- Planning hooks ----------------------------------------------------
     def plan_vm_creation(
@@ -0,0 +1,42 @@
+"""
+Short-lived node-list cache shared by the agent adapter and CLI helpers.
+
+Cluster-wide sweeps fetch ``nodes`` before fanning out per node; membership
+rarely changes, so a listing is reused for a few seconds per Proxmox host.
+The cache only helps callers that stay in one process (adapters in a worker,
+CLI functions called repeatedly); a one-shot CLI run always starts empty.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+NODES_CACHE_TTL = 30.0
+
+
+class NodeCache:
+    """Node listings keyed by Proxmox host, reused for ``ttl`` seconds."""
+
+    def __init__(self, ttl: float = NODES_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+    def get(self, host: str) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of the fresh listing for ``host``, or None if stale/missing."""
+        entry = self._entries.get(host)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        return list(entry[1])
+
+    def put(self, host: str, nodes: Any) -> List[Dict[str, Any]]:
+        """Store the API's ``nodes`` payload for ``host`` and return a copy."""
+        listing = cast(List[Dict[str, Any]], nodes)
+        self._entries[host] = (time.monotonic(), listing)
+        return list(listing)
+
+    def clear(self, host: Optional[str] = None) -> None:
+        """Forget ``host`` (or every host) so the next lookup hits the API."""
+        if host is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(host, None)
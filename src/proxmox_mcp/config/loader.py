@@ -10,11 +10,15 @@ This module handles loading and validation of server configuration:
 The module ensures that all required configuration is present
 and valid before the server starts operation.
 """
-import json
 import os
-from typing import Optional
+import stat
+from typing import Dict, Optional, Tuple
+from .._json import JSONDecodeError, loads
 from .models import Config
 
+# Parsed configs keyed by (absolute path, mtime_ns, size); one entry per path.
+_CFG_CACHE: Dict[Tuple[str, int, int], Config] = {}
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """Load and validate configuration from JSON file.
 
@@ -24,6 +28,11 @@ def load_config(config_path: Optional[str] = None) -> Config:
     3. Validates required fields are present
     4. Converts to typed Config object using Pydantic
     
+    Parsed configurations are cached per file and reused until the file's
+    modification time or size changes; callers always receive a private copy.
+    Pipes and other non-regular files (e.g. ``<(cat config.json)``) are read
+    to EOF and never cached.
+
     Configuration must include:
     - Proxmox connection settings (host, port, etc.)
     - Authentication credentials (user, token)
@@ -63,12 +72,35 @@ def load_config(config_path: Optional[str] = None) -> Config:
         raise ValueError("PROXMOX_MCP_CONFIG environment variable must be set")
 
     try:
-        with open(config_path) as f:
-            config_data = json.load(f)
+        f = open(config_path, "rb")
+    except OSError as e:
+        raise ValueError(f"Failed to load config: {e}")
+
+    with f:
+        try:
+            st = os.fstat(f.fileno())
+            abspath = os.path.abspath(config_path)
+            key = (abspath, st.st_mtime_ns, st.st_size) if stat.S_ISREG(st.st_mode) else None
+            cached = _CFG_CACHE.get(key) if key is not None else None
+            if cached is not None:
+                return cached.model_copy(deep=True)
+
+            config_data = loads(f.read())
             if not config_data.get('proxmox', {}).get('host'):
                 raise ValueError("Proxmox host cannot be empty")
-            return Config(**config_data)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in config file: {e}")
-    except Exception as e:
-        raise ValueError(f"Failed to load config: {e}")
+            config = Config(**config_data)
+        except JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in config file: {e}")
+        except Exception as e:
+            raise ValueError(f"Failed to load config: {e}")
+
+    if key is None:
+        return config
+
+    for stale in [k for k in _CFG_CACHE if k[0] == abspath]:
+        del _CFG_CACHE[stale]
+    _CFG_CACHE[key] = config
+    return config.model_copy(deep=True)
+
+
+load_config.cache_clear = _CFG_CACHE.clear  # type: ignore[attr-defined]
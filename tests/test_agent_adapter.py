@@ -1,8 +1,13 @@
+import copy
+import dataclasses
 import json
+import pickle
 from pathlib import Path
 
 import pytest
+from proxmoxer import ResourceException
 
+from proxmox_mcp.agent import node_cache
 from proxmox_mcp.agent.adapter import AdapterActionPlan, ProxmoxAgentAdapter
 
 
@@ -32,13 +37,34 @@ class _DummyNodeEndpoint:
 class _DummyNodeResource:
     def __init__(self, node_name):
         self.node_name = node_name
-        self.qemu = _DummyQemuEndpoint([{"node": node_name, "vmid": 100}])
+        # nodes/<node>/qemu entries carry no "node" field.
+        self.qemu = _DummyQemuEndpoint(
+            [{"vmid": 100, "name": f"vm-{node_name}", "cpus": 2, "status": "running"}]
+        )
+
+
+class _DummyResourcesEndpoint:
+    def __init__(self, resources):
+        self._resources = resources
+
+    def get(self, **params):
+        assert params == {"type": "vm"}
+        if self._resources is None:
+            # What older Proxmox releases answer for an unknown endpoint.
+            raise ResourceException(501, "Not Implemented", "GET /cluster/resources not implemented")
+        return self._resources
+
+
+class _DummyCluster:
+    def __init__(self, resources=None):
+        self.resources = _DummyResourcesEndpoint(resources)
 
 
 class _DummyClient:
     def __init__(self):
         self.version = _DummyEndpoint({"version": "test"})
         self.nodes = _DummyNodeEndpoint([{"node": "pve"}])
+        self.cluster = _DummyCluster()
 
 
 def _write_config(tmp_path: Path) -> Path:
@@ -52,8 +78,12 @@ def _write_config(tmp_path: Path) -> Path:
     return cfg_path
 
 
-def test_adapter_lazy_connection(tmp_path):
-    cfg_path = _write_config(tmp_path)
+@pytest.fixture(scope="session")
+def cfg_path(tmp_path_factory) -> Path:
+    return _write_config(tmp_path_factory.mktemp("adapter"))
+
+
+def test_adapter_lazy_connection(cfg_path):
     adapter = ProxmoxAgentAdapter(config_path=str(cfg_path), auto_connect=False, client_factory=lambda *_: _DummyClient())
 
     with pytest.raises(RuntimeError):
@@ -63,8 +93,7 @@ def test_adapter_lazy_connection(tmp_path):
     assert client is adapter.api
 
 
-def test_adapter_builds_action_plan(tmp_path):
-    cfg_path = _write_config(tmp_path)
+def test_adapter_builds_action_plan(cfg_path):
     adapter = ProxmoxAgentAdapter(config_path=str(cfg_path), auto_connect=False, client_factory=lambda *_: _DummyClient())
 
     plan = adapter.plan_vm_creation(
@@ -82,3 +111,195 @@ def test_adapter_builds_action_plan(tmp_path):
 
     with pytest.raises(NotImplementedError):
         adapter.execute_plan(plan)
+
+
+def test_adapter_lists_vms_across_nodes(cfg_path):
+    client = _DummyClient()
+    client.nodes = _DummyNodeEndpoint([{"node": "pve1"}, {"node": "pve2"}, {"node": "pve3"}])
+    adapter = ProxmoxAgentAdapter(config_path=str(cfg_path), auto_connect=False, client_factory=lambda *_: client)
+
+    vms = adapter.list_vms()
+
+    assert [(vm["node"], vm["name"]) for vm in vms] == [
+        ("pve1", "vm-pve1"), ("pve2", "vm-pve2"), ("pve3", "vm-pve3"),
+    ]
+    assert adapter.list_vms(node="pve9") == [
+        {"vmid": 100, "name": "vm-pve9", "cpus": 2, "status": "running", "node": "pve9"}
+    ]
+
+
+def test_adapter_caches_node_list(cfg_path):
+    client = _DummyClient()
+    calls = []
+    client.nodes.get = lambda: calls.append(1) or [{"node": "pve"}]
+    adapter = ProxmoxAgentAdapter(config_path=str(cfg_path), auto_connect=False, client_factory=lambda *_: client)
+
+    adapter.list_nodes()
+    adapter.list_vms()
+    assert len(calls) == 1
+
+    adapter.refresh_nodes()
+    assert len(calls) == 2
+
+
+def test_node_cache_expires_per_host(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(node_cache.time, "monotonic", lambda: now[0])
+    cache = node_cache.NodeCache(ttl=30.0)
+
+    assert cache.put("pve-a", [{"node": "pve1"}]) == [{"node": "pve1"}]
+    assert cache.get("pve-a") == [{"node": "pve1"}]
+    assert cache.get("pve-b") is None
+
+    now[0] += 30.0
+    assert cache.get("pve-a") is None
+
+
+def test_adapter_lists_vms_from_cluster_resources(cfg_path):
+    client = _DummyClient()
+    client.cluster = _DummyCluster([
+        {"id": "qemu/100", "type": "qemu", "node": "pve1", "vmid": 100, "maxcpu": 2},
+        {"id": "lxc/200", "type": "lxc", "node": "pve1", "vmid": 200, "maxcpu": 1},
+        {"id": "qemu/101", "type": "qemu", "node": "pve2", "vmid": 101, "maxcpu": 4},
+    ])
+    client.nodes.get = lambda: pytest.fail("per-node listing should not be needed")
+    adapter = ProxmoxAgentAdapter(config_path=str(cfg_path), auto_connect=False, client_factory=lambda *_: client)
+
+    vms = adapter.list_vms()
+
+    assert [vm["vmid"] for vm in vms] == [100, 101]
+
+
+def test_action_plan_is_immutable_and_hashable():
+    params = {"vmid": 101}
+    plan = AdapterActionPlan(action="create_vm", parameters=params, evidence=["ticket-1"])
+
+    params["vmid"] = 102
+    assert plan.parameters == {"vmid": 101}
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        plan.dry_run = False
+
+    live = dataclasses.replace(plan, dry_run=False, evidence=plan.evidence + ("approved",))
+    assert live.evidence == ("ticket-1", "approved")
+    assert plan.dry_run is True
+    assert len({plan, AdapterActionPlan(action="create_vm", parameters={"vmid": 101}, evidence=("ticket-1",))}) == 1
+
+
+def test_action_plan_round_trips_through_asdict_copy_and_pickle():
+    plan = AdapterActionPlan(
+        action="create_vm", parameters={"vmid": 101, "tags": ["a"]}, evidence=("ticket-1",)
+    )
+
+    assert dataclasses.asdict(plan)["parameters"] == {"vmid": 101, "tags": ["a"]}
+    assert copy.deepcopy(plan) == plan
+    assert pickle.loads(pickle.dumps(plan)) == plan
+
+
+@pytest.fixture
+def shared_adapters(monkeypatch):
+    monkeypatch.setattr(ProxmoxAgentAdapter, "_default_client_factory", lambda *_: _DummyClient())
+    ProxmoxAgentAdapter.clear_shared()
+    yield
+    ProxmoxAgentAdapter.clear_shared()
+
+
+def test_shared_adapter_is_reused_per_config(cfg_path, shared_adapters):
+    adapter = ProxmoxAgentAdapter.shared(str(cfg_path))
+    assert ProxmoxAgentAdapter.shared(str(cfg_path)) is adapter
+    assert adapter.list_nodes() == [{"node": "pve"}]
+
+    ProxmoxAgentAdapter.clear_shared()
+    with pytest.raises(RuntimeError):
+        _ = adapter.api
+    assert ProxmoxAgentAdapter.shared(str(cfg_path)) is not adapter
+
+
+def test_shared_adapter_keys_on_resolved_path(cfg_path, shared_adapters, monkeypatch):
+    monkeypatch.chdir(cfg_path.parent)
+    monkeypatch.setenv(ProxmoxAgentAdapter.CONFIG_ENV_VAR, cfg_path.name)
+
+    adapter = ProxmoxAgentAdapter.shared()
+    assert ProxmoxAgentAdapter.shared(cfg_path.name) is adapter
+    assert ProxmoxAgentAdapter.shared(str(cfg_path)) is adapter
+
+
+def test_default_client_pool_is_sized_for_fanout(cfg_path, monkeypatch):
+    from proxmoxer import ProxmoxAPI
+
+    from proxmox_mcp.core.proxmox import ProxmoxManager
+
+    def _init(self, prox_cfg, auth_cfg):
+        self._api = ProxmoxAPI(
+            prox_cfg.host, user=auth_cfg.user, token_name=auth_cfg.token_name,
+            token_value=auth_cfg.token_value, verify_ssl=False,
+        )
+
+    monkeypatch.setattr(ProxmoxManager, "__init__", _init)
+    monkeypatch.setattr(ProxmoxManager, "get_api", lambda self: self._api)
+    adapter = ProxmoxAgentAdapter(config_path=str(cfg_path))
+
+    pool_adapter = adapter.api._store["session"].get_adapter("https://pve.local:8006/")
+    assert pool_adapter._pool_maxsize == ProxmoxAgentAdapter.MAX_FANOUT
+
+
+def test_adapter_does_not_mask_unexpected_cluster_errors(cfg_path):
+    client = _DummyClient()
+    client.cluster.resources.get = lambda **_: {}["boom"]
+    adapter = ProxmoxAgentAdapter(config_path=str(cfg_path), auto_connect=False, client_factory=lambda *_: client)
+
+    with pytest.raises(KeyError):
+        adapter.list_vms()
+
+
+def test_adapter_does_not_fall_back_on_connection_errors(cfg_path):
+    from proxmox_mcp.vendor.proxmoxia import ProxmoxConnectionError
+
+    def _unreachable(**_):
+        raise ProxmoxConnectionError("timed out")
+
+    client = _DummyClient()
+    client.cluster.resources.get = _unreachable
+    client.nodes.get = lambda: pytest.fail("per-node listing should not be attempted")
+    adapter = ProxmoxAgentAdapter(config_path=str(cfg_path), auto_connect=False, client_factory=lambda *_: client)
+
+    with pytest.raises(ProxmoxConnectionError):
+        adapter.list_vms()
+
+
+@pytest.mark.asyncio
+async def test_adapter_alist_vms_falls_back_to_node_fanout(cfg_path):
+    httpx = pytest.importorskip("httpx")
+    from proxmox_mcp.vendor.proxmoxia.aio import AsyncProxmox
+
+    routes = {
+        "/api2/json/cluster/resources": (501, {"data": None}),
+        "/api2/json/nodes": (200, {"data": [{"node": "pve1"}, {"node": "pve2"}]}),
+        "/api2/json/nodes/pve1/qemu": (200, {"data": [{"vmid": 100}]}),
+        "/api2/json/nodes/pve2/qemu": (200, {"data": [{"vmid": 101}]}),
+    }
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        status, payload = routes[request.url.path]
+        return httpx.Response(status, json=payload)
+
+    clients = []
+
+    def _async_factory(prox_cfg, auth_cfg):
+        clients.append(AsyncProxmox(prox_cfg.host, transport=httpx.MockTransport(handler)))
+        return clients[-1]
+
+    adapter = ProxmoxAgentAdapter(
+        config_path=str(cfg_path), auto_connect=False, client_factory=lambda *_: _DummyClient(),
+        async_client_factory=_async_factory,
+    )
+
+    expected = [{"vmid": 100, "node": "pve1"}, {"vmid": 101, "node": "pve2"}]
+    assert await adapter.alist_vms() == expected
+    assert await adapter.alist_vms() == expected
+    assert len(clients) == 1
+    assert seen.count("/api2/json/nodes") == 1
+
+    await adapter.aclose()
+    assert clients[0].client.is_closed
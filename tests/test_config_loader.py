@@ -0,0 +1,55 @@
+import json
+import os
+import threading
+
+import pytest
+
+from proxmox_mcp.config.loader import load_config
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
+def _write(path, host):
+    path.write_text(json.dumps({
+        "proxmox": {"host": host},
+        "auth": {"user": "api@pve", "token_name": "demo", "token_value": "abc123"},
+        "logging": {"level": "INFO", "format": "%(message)s"},
+    }))
+
+
+def test_load_config_reuses_cached_parse(tmp_path, monkeypatch):
+    cfg_path = tmp_path / "config.json"
+    _write(cfg_path, "pve.local")
+    first = load_config(str(cfg_path))
+
+    monkeypatch.setattr(
+        "proxmox_mcp.config.loader.Config", lambda **_: pytest.fail("config re-parsed")
+    )
+    second = load_config(str(cfg_path))
+
+    assert second == first
+    assert second is not first
+
+
+def test_load_config_reloads_when_file_changes(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    _write(cfg_path, "pve.local")
+    assert load_config(str(cfg_path)).proxmox.host == "pve.local"
+
+    _write(cfg_path, "pve-other.local")
+    assert load_config(str(cfg_path)).proxmox.host == "pve-other.local"
+
+
+def test_load_config_reads_pipes_without_caching(tmp_path):
+    fifo = tmp_path / "config.fifo"
+    os.mkfifo(fifo)
+    for host in ("pve.local", "pve-other.local"):
+        writer = threading.Thread(target=_write, args=(fifo, host))
+        writer.start()
+        assert load_config(str(fifo)).proxmox.host == host
+        writer.join()
@@ -0,0 +1,122 @@
+"""
+Tests for the vendored Proxmoxia transport.
+"""
+
+import json
+
+import pytest
+from requests.adapters import BaseAdapter
+from requests.models import Response
+
+from proxmox_mcp.vendor.proxmoxia import Connector, Proxmox, ProxmoxHTTPError
+
+
+class _StubAdapter(BaseAdapter):
+    """Transport adapter that records requests and replays canned responses."""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status, body = self.responses.pop(0)
+        response = Response()
+        response.status_code = status
+        response._content = body
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def connector():
+    return Connector("pve.local")
+
+
+def _mount(connector, responses):
+    adapter = _StubAdapter(responses)
+    connector.session.mount("https://", adapter)
+    return adapter
+
+
+def test_api_token_is_sent_from_session(connector):
+    adapter = _mount(connector, [(200, json.dumps({"data": [{"node": "pve"}]}).encode())])
+    connector.use_api_token("api@pve", "demo", "secret")
+
+    assert Proxmox(connector).nodes.get() == [{"node": "pve"}]
+
+    sent = adapter.requests[0]
+    assert sent.url == "https://pve.local:8006/api2/json/nodes"
+    assert sent.headers["Authorization"] == "PVEAPIToken=api@pve!demo=secret"
+
+
+def test_reauth_replaces_previous_credentials(connector):
+    ticket = {"data": {"ticket": "T1", "CSRFPreventionToken": "C1"}}
+    adapter = _mount(connector, [(200, json.dumps(ticket).encode()), (200, b'{"data": {}}')])
+    connector.use_api_token("api@pve", "demo", "secret")
+    connector.get_auth_token("root@pam", "password")
+
+    Proxmox(connector).version.get()
+
+    sent = adapter.requests[-1]
+    assert "Authorization" not in sent.headers
+    assert sent.headers["Cookie"] == "PVEAuthCookie=T1"
+    assert sent.headers["CSRFPreventionToken"] == "C1"
+
+
+def test_empty_response_returns_none(connector):
+    adapter = _mount(connector, [(204, b"")])
+    connector.use_api_token("api@pve", "demo", "secret")
+
+    assert Proxmox(connector).nodes("pve").qemu(100).status.start.post() is None
+    assert adapter.requests[0].method == "POST"
+    assert adapter.requests[0].body is None
+
+
+def test_error_status_raises_http_error(connector):
+    _mount(connector, [(501, b'{"data": null}')])
+    connector.use_api_token("api@pve", "demo", "secret")
+
+    with pytest.raises(ProxmoxHTTPError) as excinfo:
+        Proxmox(connector).cluster.resources.get(type="vm")
+    assert excinfo.value.status_code == 501
+
+
+def _mock_transport(httpx, routes, seen):
+    def handler(request):
+        seen.append(request)
+        status, payload = routes[request.url.path]
+        return httpx.Response(status, json=payload)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_async_client_issues_authenticated_requests():
+    httpx = pytest.importorskip("httpx")
+    from proxmox_mcp.vendor.proxmoxia.aio import AsyncProxmox
+
+    seen = []
+    routes = {"/api2/json/nodes/pve/qemu": (200, {"data": [{"vmid": 100}]})}
+    async with AsyncProxmox("pve.local", transport=_mock_transport(httpx, routes, seen)) as client:
+        client.use_api_token("api@pve", "demo", "secret")
+        assert await client.nodes("pve").qemu.get() == [{"vmid": 100}]
+
+    assert seen[0].headers["Authorization"] == "PVEAPIToken=api@pve!demo=secret"
+
+
+@pytest.mark.asyncio
+async def test_async_client_maps_auth_failures():
+    httpx = pytest.importorskip("httpx")
+    from proxmox_mcp.vendor.proxmoxia import ProxmoxAuthError
+    from proxmox_mcp.vendor.proxmoxia.aio import AsyncProxmox
+
+    routes = {"/api2/json/version": (401, {"data": None})}
+    async with AsyncProxmox("pve.local", transport=_mock_transport(httpx, routes, [])) as client:
+        with pytest.raises(ProxmoxAuthError):
+            await client.version.get()